@@ -1,3 +1,4 @@
+import shutil
 from typing import Optional
 
 import typer
@@ -12,6 +13,7 @@ from installer_app.utils.constants import (
 from installer_app.utils.exceptions import PackageInstallerError
 from installer_app.core.config import load_config
 from installer_app.core.factory import InstallerFactory
+from installer_app.core.lockfile import load_lockfile, save_lockfile
 from installer_app.core.logger import logger
 
 
@@ -30,14 +32,20 @@ def install(
         "-v",
         help=f"Version to install (default: {Config.DEFAULT_VERSION})",
     ),
+    locked: bool = typer.Option(
+        False,
+        "--locked",
+        help=f"Install the exact artifacts recorded in '{Config.LOCK_FILENAME}'",
+    ),
 ):
     logger.info(
         f"Installing {package} (version: {version}) using {installer_type.value}"
+        + (" from lockfile" if locked else "")
     )
 
     try:
         installer = InstallerFactory.create_installer(
-            installer_type.value, package, version
+            installer_type.value, package, version, locked
         )
         installer.install()
         typer.echo(
@@ -140,5 +148,67 @@ def list_packages():
         raise typer.Exit(CommandResult.FAILURE)
 
 
+@app.command()
+def lock(
+    installer_type: Optional[PackageType] = typer.Argument(
+        None, help="Only lock packages of this installer type (default: all available)"
+    ),
+):
+    logger.info("Locking allowed packages and versions from config")
+
+    try:
+        config = load_config()
+
+        # entries for types not locked in this run are kept as they are
+        try:
+            lock_data = load_lockfile()
+        except FileNotFoundError:
+            lock_data = {}
+
+        for pkg_type, title, _ in PackageInfo.get_all_types():
+            if installer_type is not None and pkg_type != installer_type:
+                continue
+
+            pkg_config = config.get(pkg_type.value, {})
+            packages = pkg_config.get(Config.ALLOWED_PACKAGES_KEY, {})
+            if not packages:
+                continue
+
+            if installer_type is None and shutil.which(pkg_type.value) is None:
+                logger.warning(
+                    f"⚠️ {pkg_type.value} is not installed, skipping its packages"
+                )
+                typer.echo(f"\n{title} skipped ({pkg_type.value} not installed)")
+                continue
+
+            typer.echo(f"\n{title}")
+            type_entries = {}
+            for pkg, versions in packages.items():
+                for version in versions:
+                    installer = InstallerFactory.create_installer(
+                        pkg_type.value, pkg, version
+                    )
+                    entry = installer.lock()
+                    type_entries.setdefault(pkg, {})[version] = entry
+                    resolved = entry.get("digest") or entry.get("version")
+                    typer.echo(f"  • {pkg} ({version}) -> {resolved}")
+            lock_data[pkg_type.value] = type_entries
+
+        save_lockfile(lock_data)
+        typer.echo(f"\n{Emoji.SUCCESS} Lockfile written to '{Config.LOCK_FILENAME}'")
+
+    except FileNotFoundError:
+        typer.echo(
+            f"{Emoji.ERROR} Configuration file '{Config.FILENAME}' not found", err=True
+        )
+        raise typer.Exit(CommandResult.FAILURE)
+    except PackageInstallerError as e:
+        typer.echo(f"{Emoji.ERROR} Locking failed: {e}", err=True)
+        raise typer.Exit(CommandResult.FAILURE)
+    except Exception as e:
+        typer.echo(f"{Emoji.ERROR} Unexpected error: {e}", err=True)
+        raise typer.Exit(CommandResult.FAILURE)
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -3,6 +3,8 @@ from installer_app.installers.brew_installer import BrewInstaller
 from installer_app.installers.docker_installer import DockerInstaller
 from installer_app.core.installer import Installer
 from installer_app.core.config import load_config
+from installer_app.core.lockfile import get_lock_entry, load_lockfile
+from installer_app.utils.exceptions import PackageInstallerError
 from typing import Optional
 
 
@@ -11,7 +13,10 @@ class InstallerFactory:
 
     @staticmethod
     def create_installer(
-        installer_type: str, package_name: str, version: Optional[str] = "latest"
+        installer_type: str,
+        package_name: str,
+        version: Optional[str] = "latest",
+        locked: bool = False,
     ) -> Installer:
         installer_class = InstallerFactory.installers.get(installer_type)
         if not installer_class:
@@ -20,4 +25,19 @@ class InstallerFactory:
         config = load_config()
         installer_config = config.get(installer_type, {})
 
-        return installer_class(package_name, installer_config, version)
+        lock_entry = None
+        if locked:
+            try:
+                lock_data = load_lockfile()
+            except FileNotFoundError as e:
+                raise PackageInstallerError(str(e)) from e
+            lock_entry = get_lock_entry(
+                lock_data, installer_type, package_name, version
+            )
+            if lock_entry is None:
+                raise PackageInstallerError(
+                    f"No lock entry for {installer_type} package '{package_name}' "
+                    f"(version: {version}). Run 'installer lock' first."
+                )
+
+        return installer_class(package_name, installer_config, version, lock_entry)
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from installer_app.core.process_lock import file_lock
+from installer_app.utils.constants import Config
+from installer_app.utils.exceptions import PackageInstallerError
 
 
 def validate_package(func: Callable) -> Callable:
@@ -12,17 +16,45 @@ def validate_package(func: Callable) -> Callable:
     return wrapper
 
 
+def with_process_lock(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self: "Installer", *args, **kwargs):
+        with file_lock(self._get_lock_name(), self.lock_timeout):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 class Installer(ABC):
     def __init__(
-        self, package_name: str, config: dict, version: Optional[str] = "latest"
+        self,
+        package_name: str,
+        config: dict,
+        version: Optional[str] = "latest",
+        lock_entry: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.package_name = package_name
         self.version = version
         self.config = config
+        self.lock_entry = lock_entry
+        self.lock_timeout = self._get_lock_timeout()
         self.allowed_packages: Dict[str, List[str]] = self.config.get(
             "allowed_packages", {}
         )
 
+    def _get_lock_timeout(self) -> float:
+        value = self.config.get(Config.LOCK_TIMEOUT_KEY, Config.DEFAULT_LOCK_TIMEOUT)
+        try:
+            timeout = float(value)
+        except (TypeError, ValueError):
+            timeout = -1.0
+        if not timeout >= 0:
+            raise PackageInstallerError(
+                f"Invalid {Config.LOCK_TIMEOUT_KEY} '{value}': "
+                f"expected a non-negative number of seconds"
+            )
+        return timeout
+
     def _validate_package(self) -> None:
         if self.package_name not in self.allowed_packages:
             raise ValueError(
@@ -35,6 +67,11 @@ class Installer(ABC):
                 f"Allowed versions are: {self.allowed_packages[self.package_name]}"
             )
 
+    @abstractmethod
+    def _get_lock_name(self) -> str:
+        """Name of the cross-process lock guarding this installer's target."""
+        pass
+
     @abstractmethod
     @validate_package
     def install(self) -> None:
@@ -49,3 +86,9 @@ class Installer(ABC):
     @validate_package
     def status(self) -> bool:
         pass
+
+    @abstractmethod
+    @validate_package
+    def lock(self) -> Dict[str, Any]:
+        """Resolve the package to the exact artifacts recorded in the lockfile."""
+        pass
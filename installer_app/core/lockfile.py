@@ -0,0 +1,39 @@
+# reading and writing the lockfile of resolved package artifacts
+import os
+import tempfile
+import yaml
+from typing import Any, Dict, Optional
+
+from installer_app.utils.constants import Config
+
+
+def load_lockfile(path: str = Config.LOCK_FILENAME) -> Dict[str, Any]:
+    try:
+        with open(path) as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Lockfile '{path}' not found. Run 'installer lock' first."
+        )
+
+
+def save_lockfile(data: Dict[str, Any], path: str = Config.LOCK_FILENAME) -> None:
+    # write next to the target and swap it in, so readers never see a partial file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".installer-lock-", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            yaml.safe_dump(data, f, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_lock_entry(
+    lock_data: Dict[str, Any], installer_type: str, package_name: str, version: str
+) -> Optional[Dict[str, Any]]:
+    return lock_data.get(installer_type, {}).get(package_name, {}).get(version)
@@ -0,0 +1,115 @@
+# file-based locks that serialize conflicting installer processes
+import errno
+import fcntl
+import os
+import re
+import stat
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from installer_app.core.logger import logger
+from installer_app.utils.constants import ProcessLock
+from installer_app.utils.exceptions import LockTimeoutError, PackageInstallerError
+
+
+def _check_lock_directory(directory: str) -> None:
+    # the default path is predictable, so never trust a directory another user made
+    st = os.lstat(directory)
+    mode = stat.S_IMODE(st.st_mode)
+    problem = None
+    if not stat.S_ISDIR(st.st_mode):
+        problem = "is not a directory"
+    elif st.st_uid not in (0, os.geteuid()):
+        problem = f"is owned by uid {st.st_uid}, not root or the current user"
+    elif mode & (stat.S_IWGRP | stat.S_IWOTH) and not mode & stat.S_ISVTX:
+        problem = f"is group/world-writable without the sticky bit (mode {oct(mode)})"
+    if problem:
+        raise PackageInstallerError(
+            f"Refusing to use lock directory '{directory}': it {problem}. "
+            f"Remove it or set {ProcessLock.DIRECTORY_ENV} to a trusted directory."
+        )
+
+
+def _lock_directory() -> str:
+    directory = os.environ.get(ProcessLock.DIRECTORY_ENV, ProcessLock.DEFAULT_DIRECTORY)
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    try:
+        os.mkdir(directory, 0o700)
+        # mkdir applies the umask, so widen the mode explicitly
+        os.chmod(directory, ProcessLock.DIRECTORY_MODE)
+    except FileExistsError:
+        pass
+    _check_lock_directory(directory)
+    return directory
+
+
+def _lock_path(directory: str, name: str) -> str:
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name).strip("_")
+    return os.path.join(directory, f"{safe_name}.lock")
+
+
+def _open_lock_file(path: str) -> int:
+    flags = os.O_RDWR | os.O_NOFOLLOW | os.O_CLOEXEC
+    created = False
+    try:
+        try:
+            fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, ProcessLock.FILE_MODE)
+            created = True
+        except FileExistsError:
+            fd = os.open(path, flags)
+    except OSError as e:
+        if e.errno == errno.ELOOP:
+            raise PackageInstallerError(
+                f"Refusing to use lock file '{path}': it is a symbolic link"
+            ) from e
+        raise PackageInstallerError(
+            f"Cannot open lock file '{path}': {e}. Set {ProcessLock.DIRECTORY_ENV} "
+            f"to a directory writable by every user running the installer."
+        ) from e
+
+    st = os.fstat(fd)
+    if not stat.S_ISREG(st.st_mode) or st.st_nlink != 1:
+        os.close(fd)
+        raise PackageInstallerError(
+            f"Refusing to use lock file '{path}': not a regular, singly-linked file"
+        )
+    if created:
+        # open() applies the umask; other users rely on the mode set here
+        os.fchmod(fd, ProcessLock.FILE_MODE)
+    return fd
+
+
+@contextmanager
+def file_lock(name: str, timeout: float) -> Iterator[float]:
+    """Hold an exclusive lock on `name`, yielding the seconds spent waiting."""
+    path = _lock_path(_lock_directory(), name)
+    start = time.monotonic()
+
+    fd = _open_lock_file(path)
+    try:
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if not waiting:
+                    logger.info(f"⏳ Waiting for lock '{name}' held by another process")
+                    waiting = True
+                if time.monotonic() - start >= timeout:
+                    raise LockTimeoutError(
+                        f"Timed out after {timeout:g}s waiting for lock '{name}' ({path})"
+                    )
+                time.sleep(ProcessLock.POLL_INTERVAL)
+
+        waited = time.monotonic() - start
+        logger.info(f"🔒 Acquired lock '{name}' (waited {waited:.2f}s)")
+        try:
+            yield waited
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            logger.debug(f"🔓 Released lock '{name}'")
+    finally:
+        os.close(fd)
@@ -1,9 +1,14 @@
-from typing import List
+from typing import Any, Dict, List
 
 from installer_app.installers.package_installer import PackageInstaller
+from installer_app.utils.exceptions import PackageInstallerError
+from installer_app.core.logger import logger
 
 
 class BrewInstaller(PackageInstaller):
+    # brew install otherwise runs 'brew update' first, re-resolving every formula
+    LOCKED_ENV = {"HOMEBREW_NO_AUTO_UPDATE": "1"}
+
     def _get_installer_name(self) -> str:
         return "brew"
 
@@ -15,3 +20,56 @@ class BrewInstaller(PackageInstaller):
 
     def _get_status_command(self) -> List[str]:
         return ["brew", "list", self.package_name]
+
+    def _get_info_command(self) -> List[str]:
+        return ["brew", "info", "--json=v2", self.package_name]
+
+    def _get_versions_command(self) -> List[str]:
+        return ["brew", "list", "--versions", self.package_name]
+
+    def _installed_versions(self) -> List[str]:
+        command = self._get_versions_command()
+        result = self._run_command(
+            command, "version check", raise_on_error=False, env=self.LOCKED_ENV
+        )
+        # output looks like "<package> <version> [<version> ...]"
+        return result.stdout.split()[1:]
+
+    def lock(self) -> Dict[str, Any]:
+        command = self._get_info_command()
+        info = self._run_json_command(command, "lock")
+
+        if info.get("formulae"):
+            formula = info["formulae"][0]
+            version = formula["versions"]["stable"]
+            # match the pkg_version that 'brew list --versions' reports
+            if formula.get("revision", 0) > 0:
+                version = f"{version}_{formula['revision']}"
+        elif info.get("casks"):
+            version = info["casks"][0]["version"]
+        else:
+            raise PackageInstallerError(
+                f"Cannot lock {self.package_name}: brew returned no formula or cask"
+            )
+
+        logger.info(f"Locked {self.package_name} ({self.version}) to {version}")
+        return {"version": version}
+
+    def _install_locked(self) -> None:
+        locked_version = self.lock_entry["version"]
+
+        if locked_version in self._installed_versions():
+            logger.info(
+                f"{self.package_name} {locked_version} is already installed via brew"
+            )
+            return
+
+        command = self._get_install_command()
+        self._run_command(command, "locked install", env=self.LOCKED_ENV)
+
+        installed_versions = self._installed_versions()
+        if locked_version not in installed_versions:
+            raise PackageInstallerError(
+                f"brew installed {self.package_name} {installed_versions} but the "
+                f"lockfile pins {locked_version}. Run 'installer lock' to refresh it."
+            )
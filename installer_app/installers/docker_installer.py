@@ -1,7 +1,8 @@
-from installer_app.core.installer import Installer
+from installer_app.core.installer import Installer, with_process_lock
 from typing import Dict, Any, Optional
 from installer_app.core.logger import logger
 from installer_app.utils.constants import CommandResult
+from installer_app.utils.exceptions import PackageInstallerError
 import subprocess
 
 
@@ -11,8 +12,9 @@ class DockerInstaller(Installer):
         package_name: str,
         config: Dict[str, Any],
         version: Optional[str] = "latest",
+        lock_entry: Optional[Dict[str, Any]] = None,
     ) -> None:
-        super().__init__(package_name, config, version)
+        super().__init__(package_name, config, version, lock_entry)
         self.container_name = package_name
         logger.info(
             f"Initializing DockerInstaller for package: {self.package_name}, version: {self.version}"
@@ -24,10 +26,28 @@ class DockerInstaller(Installer):
             self.package_name, {"image": self.package_name, "restart": "unless-stopped"}
         )
 
+    def _get_lock_name(self) -> str:
+        # stop/rm/run races only between invocations on the same container name
+        return f"docker-{self.container_name}"
+
+    def _get_image_reference(self, config: Dict[str, Any]) -> str:
+        # a locked install pins the image by digest instead of by tag
+        if self.lock_entry is not None:
+            locked_image = self.lock_entry["image"]
+            if locked_image != config["image"]:
+                logger.warning(
+                    f"⚠️ Configured image '{config['image']}' differs from locked image "
+                    f"'{locked_image}'; installing the locked image. "
+                    f"Run 'installer lock' to refresh the lockfile."
+                )
+            return f"{locked_image}@{self.lock_entry['digest']}"
+        return f"{config['image']}:{self.version}"
+
     def _image_exists_locally(self, image: str) -> bool:
+        # works for both tag and digest references
         try:
             result = subprocess.run(
-                ["docker", "images", "-q", image],
+                ["docker", "image", "inspect", "--format", "{{.Id}}", image],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -36,6 +56,36 @@ class DockerInstaller(Installer):
         except subprocess.CalledProcessError:
             return False
 
+    def lock(self) -> Dict[str, Any]:
+        config = self._get_docker_config()
+        image = f"{config['image']}:{self.version}"
+
+        try:
+            result = subprocess.run(
+                [
+                    "docker",
+                    "buildx",
+                    "imagetools",
+                    "inspect",
+                    image,
+                    "--format",
+                    "{{.Manifest.Digest}}",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Failed to resolve digest for image: {image}"
+            if e.stderr:
+                error_msg += f"\nError: {e.stderr.strip()}"
+            logger.error(f"❌ {error_msg}")
+            raise PackageInstallerError(error_msg) from e
+
+        digest = result.stdout.strip()
+        logger.info(f"🔒 Locked {image} to {digest}")
+        return {"image": config["image"], "tag": self.version, "digest": digest}
+
     def _pull_image_with_progress(self, image: str) -> None:
         if self._image_exists_locally(image):
             logger.info(f"✅ Image already exists locally: {image}")
@@ -101,9 +151,10 @@ class DockerInstaller(Installer):
         cmd.append(image)
         return cmd
 
+    @with_process_lock
     def install(self) -> None:
         config = self._get_docker_config()
-        image = f"{config['image']}:{self.version}"
+        image = self._get_image_reference(config)
 
         try:
             self._pull_image_with_progress(image)
@@ -146,6 +197,7 @@ class DockerInstaller(Installer):
         except subprocess.CalledProcessError:
             return False
 
+    @with_process_lock
     def uninstall(self) -> None:
         logger.info(f"🛑 Uninstalling container: {self.container_name}")
 
@@ -1,10 +1,13 @@
+import json
+import os
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from installer_app.utils.constants import CommandResult
 from installer_app.utils.exceptions import PackageInstallerError
-from installer_app.core.installer import Installer
+from installer_app.core.installer import Installer, with_process_lock
 from installer_app.core.logger import logger
 
 
@@ -14,8 +17,9 @@ class PackageInstaller(Installer, ABC):
         package_name: str,
         config: Dict[str, Any],
         version: Optional[str] = "latest",
+        lock_entry: Optional[Dict[str, Any]] = None,
     ) -> None:
-        super().__init__(package_name, config, version)
+        super().__init__(package_name, config, version, lock_entry)
         self.installer_name = self._get_installer_name()
         logger.info(
             f"Initializing {self.installer_name} for package: {self.package_name}, version: {self.version}"
@@ -37,8 +41,22 @@ class PackageInstaller(Installer, ABC):
     def _get_status_command(self) -> List[str]:
         pass
 
+    @abstractmethod
+    def _install_locked(self) -> None:
+        pass
+
+    def _get_lock_name(self) -> str:
+        # one lock per manager and environment, keyed by the resolved executable
+        resolved = shutil.which(self.installer_name) or self.installer_name
+        environment = os.path.dirname(os.path.realpath(resolved))
+        return f"{self.installer_name}-{environment}"
+
     def _run_command(
-        self, command: List[str], operation: str, raise_on_error: bool = True
+        self,
+        command: List[str],
+        operation: str,
+        raise_on_error: bool = True,
+        env: Optional[Dict[str, str]] = None,
     ) -> subprocess.CompletedProcess:
         try:
             logger.info(f"Running {operation} command: {' '.join(command)}")
@@ -47,6 +65,7 @@ class PackageInstaller(Installer, ABC):
                 capture_output=True,
                 text=True,
                 check=False,
+                env={**os.environ, **env} if env else None,
             )
 
             if result.returncode == CommandResult.SUCCESS:
@@ -86,10 +105,29 @@ class PackageInstaller(Installer, ABC):
             logger.error(error_msg)
             raise PackageInstallerError(error_msg) from e
 
+    def _run_json_command(self, command: List[str], operation: str) -> Any:
+        result = self._run_command(command, operation)
+        try:
+            return json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            error_msg = (
+                f"{self.installer_name} {operation} returned invalid JSON for "
+                f"{self.package_name}: {e}"
+            )
+            if result.stdout:
+                error_msg += f"\nOutput: {result.stdout.strip()[:500]}"
+            logger.error(error_msg)
+            raise PackageInstallerError(error_msg) from e
+
+    @with_process_lock
     def install(self) -> None:
+        if self.lock_entry is not None:
+            self._install_locked()
+            return
         command = self._get_install_command()
         self._run_command(command, "install")
 
+    @with_process_lock
     def uninstall(self) -> None:
         command = self._get_uninstall_command()
         self._run_command(command, "uninstall")
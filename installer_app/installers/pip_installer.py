@@ -1,9 +1,27 @@
-from typing import List
+import json
+import os
+import tempfile
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, List
 
 from installer_app.installers.package_installer import PackageInstaller
+from installer_app.utils.exceptions import PackageInstallerError
+from installer_app.core.logger import logger
 
 
 class PipInstaller(PackageInstaller):
+    PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+    PYPI_FILES_HOSTS = ("files.pythonhosted.org", "pypi.org")
+    PYPI_TIMEOUT = 30
+    # marker values the resolved dependency closure depends on
+    ENVIRONMENT_KEYS = (
+        "implementation_name",
+        "python_version",
+        "sys_platform",
+        "platform_machine",
+    )
+
     def _get_installer_name(self) -> str:
         return "pip"
 
@@ -20,3 +38,149 @@ class PipInstaller(PackageInstaller):
 
     def _get_status_command(self) -> List[str]:
         return ["pip", "show", self.package_name]
+
+    def _get_lock_command(self) -> List[str]:
+        # resolve the full dependency closure without installing anything
+        install_command = self._get_install_command()
+        return [
+            "pip",
+            "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--quiet",
+            "--report",
+            "-",
+            *install_command[2:],
+        ]
+
+    def _get_locked_install_command(self, requirements_file: str) -> List[str]:
+        # every requirement is pinned and hashed, so pip skips resolution entirely
+        return [
+            "pip",
+            "install",
+            "--no-deps",
+            "--require-hashes",
+            "-r",
+            requirements_file,
+        ]
+
+    def _get_inspect_command(self) -> List[str]:
+        return ["pip", "inspect"]
+
+    @staticmethod
+    def _get_report_hashes(item: Dict[str, Any]) -> List[str]:
+        archive_info = item.get("download_info", {}).get("archive_info", {})
+        hashes = archive_info.get("hashes")
+        if hashes:
+            return [f"{algo}:{digest}" for algo, digest in sorted(hashes.items())]
+        if "hash" in archive_info:
+            algo, digest = archive_info["hash"].split("=", 1)
+            return [f"{algo}:{digest}"]
+        return []
+
+    def _get_index_hashes(self, item: Dict[str, Any]) -> List[str]:
+        # hashes of every distribution of the release, so any platform's wheel verifies.
+        # Only for artifacts pip actually resolved from PyPI: packages from private
+        # indexes or mirrors are never sent to PyPI, nor pinned to its artifacts.
+        name = item["metadata"]["name"]
+        version = item["metadata"]["version"]
+        download_url = item.get("download_info", {}).get("url", "")
+        if urllib.parse.urlparse(download_url).hostname not in self.PYPI_FILES_HOSTS:
+            logger.info(
+                f"{name}=={version} was not resolved from PyPI; "
+                f"locking only the hash resolved on this host"
+            )
+            return []
+
+        url = self.PYPI_JSON_URL.format(name=name)
+        try:
+            with urllib.request.urlopen(url, timeout=self.PYPI_TIMEOUT) as response:
+                project = json.load(response)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Could not fetch distribution hashes for {name}=={version} from PyPI: {e}. "
+                f"Only the hash resolved on this host will be locked."
+            )
+            return []
+        return [
+            f"sha256:{dist['digests']['sha256']}"
+            for dist in project.get("releases", {}).get(version, [])
+            if dist.get("digests", {}).get("sha256")
+        ]
+
+    def lock(self) -> Dict[str, Any]:
+        command = self._get_lock_command()
+        report = self._run_json_command(command, "lock")
+
+        requirements = []
+        resolved_version = None
+        for item in report.get("install", []):
+            name = item["metadata"]["name"]
+            version = item["metadata"]["version"]
+            hashes = sorted(
+                set(self._get_report_hashes(item))
+                | set(self._get_index_hashes(item))
+            )
+            if not hashes:
+                raise PackageInstallerError(
+                    f"Cannot lock {self.package_name}: no hash available for {name}=={version}"
+                )
+            requirements.append({"name": name, "version": version, "hashes": hashes})
+            if item.get("requested"):
+                resolved_version = version
+
+        report_environment = report.get("environment", {})
+        environment = {
+            key: report_environment[key]
+            for key in self.ENVIRONMENT_KEYS
+            if key in report_environment
+        }
+
+        logger.info(
+            f"Locked {self.package_name} ({self.version}) to {resolved_version} "
+            f"with {len(requirements)} pinned requirements for {environment}"
+        )
+        return {
+            "version": resolved_version,
+            "environment": environment,
+            "requirements": requirements,
+        }
+
+    def _check_locked_environment(self) -> None:
+        # the dependency closure was resolved for the locking host's interpreter and platform
+        locked_environment = self.lock_entry.get("environment", {})
+        if not locked_environment:
+            return
+
+        inspect = self._run_json_command(self._get_inspect_command(), "environment check")
+        current_environment = inspect.get("environment", {})
+        mismatches = [
+            f"{key}: locked {value!r}, current {current_environment.get(key)!r}"
+            for key, value in locked_environment.items()
+            if current_environment.get(key) != value
+        ]
+        if mismatches:
+            raise PackageInstallerError(
+                f"Lock entry for {self.package_name} was resolved for a different "
+                f"environment ({'; '.join(mismatches)}). "
+                f"Run 'installer lock' on a matching host."
+            )
+
+    def _install_locked(self) -> None:
+        self._check_locked_environment()
+
+        lines = [
+            " ".join(
+                [f"{req['name']}=={req['version']}"]
+                + [f"--hash={h}" for h in req["hashes"]]
+            )
+            for req in self.lock_entry["requirements"]
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            requirements_file = os.path.join(tmp_dir, "requirements.txt")
+            with open(requirements_file, "w") as f:
+                f.write("\n".join(lines) + "\n")
+
+            command = self._get_locked_install_command(requirements_file)
+            self._run_command(command, "locked install")
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from enum import Enum, IntEnum
 from typing import List, Tuple
 
@@ -26,10 +28,24 @@ class Config:
     """Configuration related constants."""
 
     FILENAME = "config.yaml"
+    LOCK_FILENAME = "installer.lock"
+    LOCK_TIMEOUT_KEY = "lock_timeout"
+    DEFAULT_LOCK_TIMEOUT = 300.0
     ALLOWED_PACKAGES_KEY = "allowed_packages"
     DEFAULT_VERSION = "latest"
 
 
+class ProcessLock:
+    """Cross-process file lock constants."""
+
+    DIRECTORY_ENV = "INSTALLER_LOCK_DIR"
+    DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), "installer-locks")
+    # shared between users like /tmp: world-writable with the sticky bit
+    DIRECTORY_MODE = 0o1777
+    FILE_MODE = 0o666
+    POLL_INTERVAL = 0.1
+
+
 class PackageInfo:
     """Package type display information."""
 
@@ -2,3 +2,9 @@ class PackageInstallerError(Exception):
     """Custom exception for package installer errors."""
     
     pass
+
+
+class LockTimeoutError(PackageInstallerError):
+    """Raised when a cross-process lock cannot be acquired in time."""
+
+    pass